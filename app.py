@@ -1,5 +1,7 @@
 import sys
 import os
+import copy
+import struct
 import json
 import subprocess
 import zipfile
@@ -8,34 +10,65 @@ import traceback
 import re
 import shutil
 import platform
+import time
 import ctypes
+import functools
+import collections
+import concurrent.futures
 import urllib.request
+import urllib.error
 from datetime import datetime
+from string import Template
 import PyQt5.QtCore as QtCore
 import PyQt5.QtWidgets as QtWidgets
 import PyQt5.QtGui as QtGui
-import PIL.Image
+
+try:
+  import orjson
+  parse_json = orjson.loads
+except ImportError:
+  parse_json = json.loads
 
 VERSION = '1.8.0'
 ENABLE_UPDATE_CHECKER = True
 UPDATE_CHECKER_URL = 'https://packager.turbowarp.org/extras-version.json'
+UPDATE_CHECKER_CACHE_SECONDS = 60 * 60 * 24
+UPDATE_CHECKER_TIMEOUT_SECONDS = 5
+
+APP_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+APP_ICON_PATH = os.path.join(APP_DIRECTORY, 'icon.png')
+RCEDIT_PATH = os.path.join(APP_DIRECTORY, 'third-party', 'rcedit', 'rcedit-x86.exe')
+ISCC_PATH = os.path.join(APP_DIRECTORY, 'third-party', 'inno', 'iscc.exe')
+
+COMMAND_OUTPUT_BUFFER_SIZE = 64 * 1024
+COMMAND_OUTPUT_TAIL_LINES = 100
+
+DEBUG_INFO_TRACEBACK_LIMIT = 10
+
+TITLE_READ_CHUNK_SIZE = 64 * 1024
+# Largest first
+ICO_SIZES = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
+VERSION_REGEX = re.compile(r'^(\d+)\.(\d+)\.(\d+)(?:-|$)')
 
 class InvalidVersion(Exception):
   def __init__(self, version):
     super().__init__(f'Invalid version: {version}')
     self.version = version
 
+@functools.lru_cache(maxsize=8)
 def get_executable_name(path):
-  files = os.listdir(path)
-  for f in files:
-    if f.endswith('.exe') and f != 'notification_helper.exe':
-      return f
+  with os.scandir(path) as entries:
+    for entry in entries:
+      if entry.name.endswith('.exe') and entry.name != 'notification_helper.exe':
+        return entry.name
   raise Exception('Cannot find executable')
 
 def parse_package_json(path):
-  with open(path, encoding='utf-8') as package_json_file:
-    return json.load(package_json_file)
+  with open(path, 'rb') as package_json_file:
+    return parse_json(package_json_file.read())
 
+# Extracted folders get a fresh temporary path and don't change while we work on them, so caching by path is safe
+@functools.lru_cache(maxsize=8)
 def find_and_parse_package_json(path):
   try:
     # Modern Electron
@@ -53,73 +86,103 @@ def get_version_from_package_json(data):
   # No version number. This code path must continue to exist for compatibility reasons
   return '1.0.0'
 
-def try_decode(text):
-  try:
-    return text.decode("utf-8")
-  except UnicodeDecodeError as e:
-    print(f"Failed to decode output: {e}")
-    return text
-
 def run_command(args, check=True):
-  # Don't set check in subprocess.run. We will check it later after logging.
-  completed = subprocess.run(
+  # iscc in particular can print a lot, so stream the output as it arrives and only
+  # keep the end of it around for the error message.
+  output_tail = collections.deque(maxlen=COMMAND_OUTPUT_TAIL_LINES)
+  with subprocess.Popen(
     args,
     stdout=subprocess.PIPE,
-    stderr=subprocess.PIPE,
-    stdin=subprocess.PIPE,
+    stderr=subprocess.STDOUT,
+    stdin=subprocess.DEVNULL,
+    bufsize=COMMAND_OUTPUT_BUFFER_SIZE,
+    encoding='utf-8',
+    errors='replace',
     creationflags=subprocess.CREATE_NO_WINDOW
-  )
-  status = completed.returncode
-  print(f'Finished command {completed.args} with exit status {status}.')
-  stdout = try_decode(completed.stdout)
-  print('Stdout:', stdout)
-  stderr = try_decode(completed.stderr)
-  print('Stderr:', stderr)
-  if check and completed.returncode != 0:
-    logged_error = stderr if stderr else stdout
-    raise Exception(f"Command {completed.args} failed with code {status}.\n\n{logged_error}")
-  return completed
-
-def find_icon(path):
+  ) as process:
+    for line in process.stdout:
+      print(line, end='')
+      output_tail.append(line)
+  status = process.returncode
+  print(f'Finished command {process.args} with exit status {status}.')
+  if check and status != 0:
+    logged_error = ''.join(output_tail)
+    raise Exception(f"Command {process.args} failed with code {status}.\n\n{logged_error}")
+  return process
+
+ICON_CANDIDATES = [
   # Modern Electron
-  p = os.path.join(path, 'resources', 'app', 'icon.png')
-  if os.path.exists(p):
-    return p
+  ('resources', 'app', 'icon.png'),
   # Old Electron
-  p = os.path.join(path, 'icon.png')
-  if os.path.exists(p):
-    return p
+  ('icon.png',)
+]
+
+def find_icon(path):
+  for candidate in ICON_CANDIDATES:
+    p = os.path.join(path, *candidate)
+    if os.path.isfile(p):
+      return p
   # NW.js
   package_json = find_and_parse_package_json(path)
   if 'window' in package_json:
     original_icon_name = package_json['window']['icon']
   return os.path.join(path, original_icon_name)
 
+@functools.lru_cache(maxsize=8)
 def get_icon_as_ico(path: str) -> str:
+  # Pillow is only needed once a project is being processed, so don't slow down startup by importing it earlier
+  import PIL.Image
   source_icon = find_icon(path)
   image = PIL.Image.open(source_icon)
+  # Icons are usually RGBA already, in which case convert() would just copy the full size image
+  if image.mode != 'RGBA':
+    image = image.convert('RGBA')
+  # Each size in the .ico is resampled from the source, so shrink huge icons once up front.
+  # The ICO writer skips sizes larger than the image in either dimension, so only shrink until
+  # the shortest side reaches the largest size to keep the same entries for non-square icons.
+  width, height = image.size
+  scale = ICO_SIZES[0][0] / min(width, height)
+  if scale < 1:
+    image = image.resize((max(ICO_SIZES[0][0], round(width * scale)), max(ICO_SIZES[0][1], round(height * scale))), PIL.Image.LANCZOS, reducing_gap=2.0)
   ico_path = f'{source_icon}.ico'
-  image.save(ico_path, format='ICO')
+  image.save(ico_path, format='ICO', sizes=ICO_SIZES)
   return ico_path
 
-def fix_exe_metadata(path: str):
+ProjectMetadata = collections.namedtuple('ProjectMetadata', [
+  'executable_name',
+  'package_name',
+  'title',
+  'version',
+  'icon'
+])
+
+def read_project_metadata(path: str) -> ProjectMetadata:
+  package_json = find_and_parse_package_json(path)
+  return ProjectMetadata(
+    executable_name=get_executable_name(path),
+    package_name=package_json.get('name'),
+    title=find_and_parse_project_title(path),
+    version=get_version_from_package_json(package_json),
+    icon=get_icon_as_ico(path)
+  )
+
+def fix_exe_metadata(path: str, metadata: ProjectMetadata):
   # we want to do roughly the same thing as electron-builder
   # https://github.com/electron-userland/electron-builder/blob/cb335ecfef1f4fd1aef94020c1eaf5ce91bef574/packages/app-builder-lib/src/winPackager.ts#L280-L295
 
-  executable_file = os.path.join(path, get_executable_name(path))
+  executable_file = os.path.join(path, metadata.executable_name)
   args = [
-    os.path.join(os.path.dirname(__file__), 'third-party/rcedit/rcedit-x86.exe'),
+    RCEDIT_PATH,
     executable_file,
   ]
 
-  icon = get_icon_as_ico(path)
   args += [
     '--set-icon',
-    icon
+    metadata.icon
   ]
 
   # non-ascii characters cause rcedit to silently fail
-  title = find_and_parse_project_title(path).encode('ascii', errors='ignore').decode().strip()
+  title = metadata.title.encode('ascii', errors='ignore').decode().strip()
   if title:
     args += [
       '--set-version-string',
@@ -133,8 +196,7 @@ def fix_exe_metadata(path: str):
       ''
     ]
 
-  package_json = find_and_parse_package_json(path)
-  version = get_version_from_package_json(package_json)
+  version = metadata.version
   args += [
     '--set-version-string',
     'FileDescription',
@@ -162,32 +224,47 @@ def make_temporary_directory(filename):
   dirname, pathname = os.path.split(filename)
   return tempfile.TemporaryDirectory(dir=dirname, prefix=f'twtmp{pathname}')
 
+HTML_ESCAPES = {
+  '&': '&amp;',
+  '>': '&gt;',
+  '<': '&lt;',
+  '\'': '&apos;',
+  '"': '&quot;'
+}
+HTML_UNESCAPES = {value: key for key, value in HTML_ESCAPES.items()}
+HTML_ESCAPE_TABLE = str.maketrans(HTML_ESCAPES)
+HTML_NEEDS_ESCAPE_REGEX = re.compile('[&<>\'"]')
+HTML_UNESCAPE_REGEX = re.compile('&(?:amp|lt|gt|apos|quot);')
+
 def escape_html(string):
-  return (
-     string
-      .replace('&', '&amp;')
-      .replace('>', '&gt;')
-      .replace('<', '&lt;')
-      .replace('\'', '&apos;')
-      .replace('"', '&quot;')
-  )
+  # Most strings have nothing to escape, so return them unchanged without building a new string
+  if not HTML_NEEDS_ESCAPE_REGEX.search(string):
+    return string
+  return string.translate(HTML_ESCAPE_TABLE)
 
 def unescape_html(string):
-  return (
-    string
-      .replace('&quot;', '"')
-      .replace('&apos;', '\'')
-      .replace('&lt;', '<')
-      .replace('&gt;', '>')
-      .replace('&amp;', '&')
-  )
+  return HTML_UNESCAPE_REGEX.sub(lambda match: HTML_UNESCAPES[match.group(0)], string)
 
 def parse_project_title(path):
-  with open(path, encoding='utf-8') as f:
-    contents = f.read()
-    title = re.search(r'<title>(.*)<\/title>', contents).group(1)
-    return unescape_html(title)
-
+  # index.html contains the entire project so it can be huge, but the title is near the start
+  contents = bytearray()
+  with open(path, 'rb') as f:
+    while True:
+      chunk = f.read(TITLE_READ_CHUNK_SIZE)
+      if not chunk:
+        break
+      search_start = max(0, len(contents) - len(b'</title>'))
+      contents += chunk
+      if contents.find(b'</title>', search_start) != -1:
+        break
+  start = contents.find(b'<title>')
+  end = contents.find(b'</title>', start + len(b'<title>'))
+  if start == -1 or end == -1:
+    raise Exception(f'Cannot find title in {path}')
+  title = contents[start + len(b'<title>'):end].decode('utf-8')
+  return unescape_html(title)
+
+@functools.lru_cache(maxsize=8)
 def find_and_parse_project_title(path):
   try:
     # Modern Electron
@@ -196,12 +273,17 @@ def find_and_parse_project_title(path):
     # NW.js, old Electron
     return parse_project_title(os.path.join(path, 'index.html'))
 
+INNO_ESCAPE_TABLE = str.maketrans({
+  '{': '{{',
+  '"': None
+})
+INNO_NEEDS_ESCAPE_REGEX = re.compile('[{"]')
+
 def escape_inno_value(string):
-  return (
-    string
-      .replace('{', '{{')
-      .replace('"', '')
-  )
+  # Same as escape_html: most values have nothing to escape, so return them without building a new string
+  if not INNO_NEEDS_ESCAPE_REGEX.search(string):
+    return string
+  return string.translate(INNO_ESCAPE_TABLE)
 
 UNSAFE_FILESYSTEM_CHARACTERS = [
   '/',
@@ -214,65 +296,51 @@ UNSAFE_FILESYSTEM_CHARACTERS = [
   '|'
 ]
 
+UNSAFE_FILESYSTEM_CHARACTER_SET = frozenset(UNSAFE_FILESYSTEM_CHARACTERS)
+UNSAFE_FILESYSTEM_CHARACTER_REGEX = re.compile('[' + re.escape(''.join(UNSAFE_FILESYSTEM_CHARACTERS)) + ']')
+
 def contains_unsafe_characters(name):
-  for i in UNSAFE_FILESYSTEM_CHARACTERS:
-    if i in name:
-      return True
-  return False
+  return not UNSAFE_FILESYSTEM_CHARACTER_SET.isdisjoint(name)
 
 def replace_unsafe_characters(name, replace_with):
-  for i in UNSAFE_FILESYSTEM_CHARACTERS:
-    name = name.replace(i, replace_with)
-  return name
+  return UNSAFE_FILESYSTEM_CHARACTER_REGEX.sub(lambda match: replace_with, name)
 
-def create_installer(path):
-  executable_file = get_executable_name(path)
-  package_json = find_and_parse_package_json(path)
-
-  package_name = package_json['name']
-  if contains_unsafe_characters(package_name):
-    formatted_unsafe_characters = ', '.join(UNSAFE_FILESYSTEM_CHARACTERS)
-    raise Exception(f'Package name "{package_name}" should not use the characters: {formatted_unsafe_characters}')
-
-  title = replace_unsafe_characters(find_and_parse_project_title(path), '')
-  version = get_version_from_package_json(package_json)
-  output_directory = 'Generated Installer'
-  output_name = f'{package_name} Setup'
-  absolute_icon_path = get_icon_as_ico(path)
-  inno_config = f"""; Generated by TurboWarp Packager Extras v{VERSION}
+# Values are substituted already escaped with escape_inno_value
+INNO_CONFIG_TEMPLATE = Template("""; Generated by TurboWarp Packager Extras v${VERSION}
 ; https://github.com/TurboWarp/packager-extras
 
-#define TITLE "{escape_inno_value(title)}"
-#define PACKAGE_NAME "{escape_inno_value(package_name)}"
-#define EXECUTABLE "{escape_inno_value(executable_file)}"
-#define VERSION "{escape_inno_value(version)}"
+#define TITLE "${TITLE}"
+#define PACKAGE_NAME "${PACKAGE_NAME}"
+#define EXECUTABLE "${EXECUTABLE}"
+#define VERSION "${PROJECT_VERSION}"
 
 [Setup]
-AppName={{#PACKAGE_NAME}}
-AppVersion={{#VERSION}}
+AppName={#PACKAGE_NAME}
+AppVersion={#VERSION}
 WizardStyle=classic
-DefaultDirName={{autopf}}\\{{#PACKAGE_NAME}}
-UninstallDisplayIcon={{app}}\\{{#EXECUTABLE}}
-DefaultGroupName={{#TITLE}}
+DefaultDirName={autopf}\\{#PACKAGE_NAME}
+UninstallDisplayIcon={app}\\{#EXECUTABLE}
+DefaultGroupName={#TITLE}
 PrivilegesRequired=lowest
-Compression=lzma2
+Compression=lzma2/fast
 SolidCompression=yes
-OutputDir={escape_inno_value(output_directory)}
-OutputBaseFilename={escape_inno_value(output_name)}
-SetupIconFile={escape_inno_value(os.path.relpath(absolute_icon_path, path))}
+LZMAUseSeparateProcess=yes
+OutputDir=${OUTPUT_DIRECTORY}
+OutputBaseFilename=${OUTPUT_NAME}
+SetupIconFile=${ICON}
 
 [Tasks]
-Name: "desktopicon"; Description: "{{cm:CreateDesktopIcon}}"; GroupDescription: "{{cm:AdditionalIcons}}"
+Name: "desktopicon"; Description: "{cm:CreateDesktopIcon}"; GroupDescription: "{cm:AdditionalIcons}"
 
 [Files]
-Source: "*"; DestDir: "{{app}}"; Excludes: "*.iss"; Flags: recursesubdirs ignoreversion
+Source: "*"; DestDir: "{app}"; Excludes: "*.iss"; Flags: recursesubdirs ignoreversion
 
 [Icons]
-Name: "{{group}}\\{{#TITLE}}"; Filename: "{{app}}\\{{#EXECUTABLE}}"
-Name: "{{userdesktop}}\\{{#TITLE}}"; Filename: "{{app}}\\{{#EXECUTABLE}}"; Tasks: desktopicon
+Name: "{group}\\{#TITLE}"; Filename: "{app}\\{#EXECUTABLE}"
+Name: "{userdesktop}\\{#TITLE}"; Filename: "{app}\\{#EXECUTABLE}"; Tasks: desktopicon
 
 [Run]
-Filename: "{{app}}\\{{#EXECUTABLE}}"; Description: "{{cm:LaunchProgram,{escape_inno_value(title)}}}"; Flags: postinstall nowait skipifsilent
+Filename: "{app}\\{#EXECUTABLE}"; Description: "{cm:LaunchProgram,${TITLE}}"; Flags: postinstall nowait skipifsilent
 
 [CustomMessages]
 DeleteUserData=Remove user data such as settings and saves?
@@ -286,14 +354,39 @@ begin
         if MsgBox(CustomMessage('DeleteUserData'), mbInformation, MB_YESNO or MB_DEFBUTTON2) = IDYES then
         begin
           // Electron
-          DelTree(ExpandConstant('{{userappdata}}\\{{#PACKAGE_NAME}}'), True, True, True);
+          DelTree(ExpandConstant('{userappdata}\\{#PACKAGE_NAME}'), True, True, True);
           // NW.js
-          DelTree(ExpandConstant('{{localappdata}}\\{{#PACKAGE_NAME}}'), True, True, True);
+          DelTree(ExpandConstant('{localappdata}\\{#PACKAGE_NAME}'), True, True, True);
         end;
       end;
   end;
 end;
-"""
+""")
+
+def create_installer(path: str, metadata: ProjectMetadata):
+  executable_file = metadata.executable_name
+  package_name = metadata.package_name
+  if not package_name:
+    raise Exception('package.json does not have a name')
+  if contains_unsafe_characters(package_name):
+    formatted_unsafe_characters = ', '.join(UNSAFE_FILESYSTEM_CHARACTERS)
+    raise Exception(f'Package name "{package_name}" should not use the characters: {formatted_unsafe_characters}')
+
+  title = replace_unsafe_characters(metadata.title, '')
+  version = metadata.version
+  output_directory = 'Generated Installer'
+  output_name = f'{package_name} Setup'
+  absolute_icon_path = metadata.icon
+  inno_config = INNO_CONFIG_TEMPLATE.substitute(
+    VERSION=VERSION,
+    TITLE=escape_inno_value(title),
+    PACKAGE_NAME=escape_inno_value(package_name),
+    EXECUTABLE=escape_inno_value(executable_file),
+    PROJECT_VERSION=escape_inno_value(version),
+    OUTPUT_DIRECTORY=escape_inno_value(output_directory),
+    OUTPUT_NAME=escape_inno_value(output_name),
+    ICON=escape_inno_value(os.path.relpath(absolute_icon_path, path))
+  )
   print("Inno config", inno_config)
   inno_config_path = os.path.join(path, 'config.iss')
   # Need to save as UTF 8 with BOM so that Inno Setup Chinese characters correctly
@@ -301,7 +394,7 @@ end;
     f.write(inno_config)
 
   run_command([
-    os.path.join(os.path.dirname(__file__), 'third-party/inno/iscc.exe'),
+    ISCC_PATH,
     inno_config_path
   ])
 
@@ -347,10 +440,9 @@ def get_debug_info():
   platform_info = f"{platform.system()} {platform.release()} {platform.machine()}"
   version_info = VERSION
   if tb is not None:
-    raw_tracebacks = reversed(traceback.extract_tb(tb))
-    def format_raw_traceback(tb):
-      return f"  at {tb.name} in {os.path.basename(tb.filename)}:{tb.lineno}"
-    formatted_traceback = "\n".join([format_raw_traceback(i) for i in raw_tracebacks])
+    # Only the innermost frames are useful in the error dialog, and we don't show source lines, so don't read them
+    raw_tracebacks = traceback.StackSummary.extract(traceback.walk_tb(tb), limit=-DEBUG_INFO_TRACEBACK_LIMIT, lookup_lines=False)
+    formatted_traceback = "\n".join(f"  at {i.name} in {os.path.basename(i.filename)}:{i.lineno}" for i in raw_tracebacks[::-1])
   else:
     formatted_traceback = ""
   return f"{exception}\n\nDebug info:\n{formatted_traceback}  ({version_info} {platform_info})"
@@ -365,50 +457,47 @@ class BaseThread(QtCore.QThread):
       traceback.print_exc()
       self.error.emit(get_debug_info())
 
-def get_zip_inner_folders(zip):
+ELECTRON_LINUX_LIBRARIES = [
+  'libffmpeg.so',
+  'libvk_swiftshader.so',
+  'libvulkan.so.1'
+]
+
+NWJS_LINUX_LIBRARIES = [
+  'lib/libnw.so',
+  'lib/libnode.so',
+  'lib/libGLESv2.so',
+  'lib/libffmpeg.so',
+  'lib/libEGL.so'
+]
+
+def index_zip_members(zip):
+  # Returns (all filenames joined by newlines, set of inner folders) in a single pass over the zip's members.
+  filenames = []
   inner_folders = set()
   for i in zip.filelist:
     filename = i.filename
-    inner_folder = filename.split('/')[0]
-    inner_folders.add(inner_folder)
-  return inner_folders
-
-def get_zip_members_in_folder(zip, prefix):
-  return [i.filename for i in zip.filelist if i.filename.startswith(f'{prefix}/')]
+    filenames.append(filename)
+    inner_folders.add(filename.partition('/')[0])
+  return '\n'.join(filenames), inner_folders
 
 def parse_zip(zip):
   if len(zip.filelist) == 0:
     raise Exception('Zip is empty.')
 
+  all_filenames, inner_folders = index_zip_members(zip)
+
   def does_file_exist(name):
-    for i in zip.filelist:
-      if f'/{name}' in i.filename:
-        return True
-    return False
+    return f'/{name}' in all_filenames
 
   def does_any_filename_contain(name):
-    for i in zip.filelist:
-      if name in i.filename:
-        return True
-    return False
-
-  electron_linux_libraries = [
-    'libffmpeg.so',
-    'libvk_swiftshader.so',
-    'libvulkan.so.1'
-  ]
-  for i in electron_linux_libraries:
+    return name in all_filenames
+
+  for i in ELECTRON_LINUX_LIBRARIES:
     if does_file_exist(i):
       raise Exception(f'Zip appears to be an Electron Linux app, but this tool only supports Windows apps. (found {i})')
 
-  nwjs_linux_libraries = [
-    'lib/libnw.so',
-    'lib/libnode.so',
-    'lib/libGLESv2.so',
-    'lib/libffmpeg.so',
-    'lib/libEGL.so'
-  ]
-  for i in nwjs_linux_libraries:
+  for i in NWJS_LINUX_LIBRARIES:
     if does_file_exist(i):
       raise Exception(f'Zip appears to be an NW.js Linux app, but this tool only supports Windows apps. (found {i})')
 
@@ -418,7 +507,6 @@ def parse_zip(zip):
   if not does_file_exist('resources.pak'):
     raise Exception('Zip is not a valid Electron or NW.js application. (resources.pak is missing)')
 
-  inner_folders = get_zip_inner_folders(zip)
   if len(inner_folders) == 0:
     raise Exception('Zip has no inner folders.')
   if len(inner_folders) != 1:
@@ -432,7 +520,82 @@ def parse_zip(zip):
   inner_folder = inner_folders.pop()
   print(f'Inner folder: {inner_folder}')
 
-  return inner_folder, get_zip_members_in_folder(zip, inner_folder)
+  return inner_folder
+
+ZIP_COPY_CHUNK_SIZE = 1024 * 1024
+REPLACED_ZIP_MEMBER_COMPRESS_LEVEL = 1
+
+def copy_zip_member_without_recompressing(source_file, info, destination_zip):
+  # zipfile has no public API for copying already-compressed data, so we write the local
+  # header and raw data ourselves and let zipfile write the central directory when it closes.
+  source_file.seek(info.header_offset)
+  local_header = source_file.read(zipfile.sizeFileHeader)
+  filename_length, extra_length = struct.unpack('<HH', local_header[26:30])
+  source_file.seek(filename_length + extra_length, os.SEEK_CUR)
+
+  copied_info = copy.copy(info)
+  # The CRC and sizes are already known, so put them in the local header instead of a data descriptor
+  copied_info.flag_bits &= ~0x08
+  # FileHeader() adds its own zip64 field if needed
+  copied_info.extra = zipfile._strip_extra(info.extra, (1,))
+  copied_info.header_offset = destination_zip.fp.tell()
+  destination_zip.fp.write(copied_info.FileHeader())
+
+  remaining = info.compress_size
+  while remaining > 0:
+    chunk = source_file.read(min(remaining, ZIP_COPY_CHUNK_SIZE))
+    if not chunk:
+      raise Exception(f'Zip ended unexpectedly while copying {info.filename}')
+    destination_zip.fp.write(chunk)
+    remaining -= len(chunk)
+
+  destination_zip.filelist.append(copied_info)
+  destination_zip.NameToInfo[copied_info.filename] = copied_info
+  destination_zip.start_dir = destination_zip.fp.tell()
+
+def replace_zip_member(source_path, destination_path, member_name, replacement_path):
+  # Copies every member of the source zip to the destination zip as-is, except member_name,
+  # which gets the contents of replacement_path instead.
+  with zipfile.ZipFile(source_path) as source_zip, open(source_path, 'rb') as source_file:
+    if member_name not in source_zip.namelist():
+      raise Exception(f'Zip does not contain {member_name}')
+    with zipfile.ZipFile(destination_path, 'w') as destination_zip:
+      for info in source_zip.infolist():
+        if info.filename == member_name:
+          # Keep the original member's compression method, but favor speed over size when deflating
+          destination_zip.write(replacement_path, member_name, compress_type=info.compress_type, compresslevel=REPLACED_ZIP_MEMBER_COMPRESS_LEVEL)
+        else:
+          copy_zip_member_without_recompressing(source_file, info, destination_zip)
+
+def extract_zip_folder_in_parallel(zip, filename, folder, dest):
+  # zipfile.ZipFile is not safe to share between threads, so each thread opens its own.
+  # Directories are all created first so that the threads never race to create the same one.
+  prefix = f'{folder}/'
+  directories = set()
+  files = []
+  for info in zip.filelist:
+    name = info.filename
+    if not name.startswith(prefix):
+      continue
+    if name.endswith('/'):
+      directories.add(name)
+    else:
+      files.append(info)
+      directories.add(name[:name.rfind('/') + 1])
+
+  for directory in sorted(directories):
+    zip.extract(zipfile.ZipInfo(directory), dest)
+
+  def extract_files(infos):
+    with zipfile.ZipFile(filename) as thread_zip:
+      for info in infos:
+        thread_zip.extract(info, dest)
+
+  worker_count = os.cpu_count() or 1
+  with concurrent.futures.ThreadPoolExecutor(max_workers=worker_count) as executor:
+    futures = [executor.submit(extract_files, files[i::worker_count]) for i in range(worker_count)]
+    for future in futures:
+      future.result()
 
 class ExtractWorker(BaseThread):
   extracted = QtCore.pyqtSignal(str)
@@ -444,9 +607,9 @@ class ExtractWorker(BaseThread):
 
   def _run(self):
     with zipfile.ZipFile(self.filename) as zip:
-      inner_folder, members_to_extract = parse_zip(zip)
-      zip.extractall(self.dest, members_to_extract)
-      extracted_contents = os.path.join(self.dest, inner_folder)
+      inner_folder = parse_zip(zip)
+      extract_zip_folder_in_parallel(zip, self.filename, inner_folder, self.dest)
+    extracted_contents = os.path.join(self.dest, inner_folder)
     print(f'Extracted to: {extracted_contents}')
     self.extracted.emit(extracted_contents)
 
@@ -457,7 +620,6 @@ class OptionsWorker(BaseThread):
 
   def __init__(self, parent):
     super().__init__(parent)
-    self.temporary_directory = parent.temporary_directory.name
     self.extracted_contents = parent.extracted_contents
     self.filename = parent.filename
     self.should_fix_exe_metadata = parent.fix_exe_metadata.isChecked()
@@ -468,63 +630,117 @@ class OptionsWorker(BaseThread):
     print(text)
     self.progress_update.emit(text)
 
-  def rezip(self):
-    self.update_progress('Recompressing (slow!)')
+  def rezip(self, metadata):
+    self.update_progress('Updating EXE in zip')
+    executable_name = metadata.executable_name
+    member_name = f'{os.path.basename(self.extracted_contents)}/{executable_name}'
     with make_temporary_file(self.filename) as temporary_archive:
-      generated_archive_name = shutil.make_archive(temporary_archive.name, 'zip', self.temporary_directory)
+      generated_archive_name = f'{temporary_archive.name}.zip'
+      replace_zip_member(self.filename, generated_archive_name, member_name, os.path.join(self.extracted_contents, executable_name))
       shutil.move(generated_archive_name, self.filename)
+    self.update_progress('Replaced EXE in original zip with fixed metadata EXE')
+
+  def build_installer(self, metadata):
+    self.update_progress('Creating installer (very slow!!)')
+    generated_installer_path = create_installer(self.extracted_contents, metadata)
+    shutil.move(generated_installer_path, self.installer_destination)
+    self.update_progress('Created installer')
 
   def _run(self):
+    metadata = read_project_metadata(self.extracted_contents)
+
     if self.should_fix_exe_metadata:
       self.update_progress('Creating EXE with fixed metadata')
-      fix_exe_metadata(self.extracted_contents)
-      self.rezip()
-      self.update_progress('Replaced EXE in original zip with fixed metadata EXE')
-
-    if self.should_create_installer:
-      self.update_progress('Creating installer (very slow!!)')
-      generated_installer_path = create_installer(self.extracted_contents)
-      shutil.move(generated_installer_path, self.installer_destination)
-      self.update_progress('Created installer')
+      fix_exe_metadata(self.extracted_contents, metadata)
+
+    # The installer is built from the extracted folder, not the zip, so these don't depend on each other
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+      futures = []
+      if self.should_fix_exe_metadata:
+        futures.append(executor.submit(self.rezip, metadata))
+      if self.should_create_installer:
+        futures.append(executor.submit(self.build_installer, metadata))
+      for future in futures:
+        future.result()
 
     self.success.emit()
 
+@functools.lru_cache(maxsize=8)
 def parse_version(full_version):
   # Returns (major, minor, patch) or raises an InvalidVersion exception
-  try:
-    version_number = full_version.split('-')[0]
-    parts = [int(i) for i in version_number.split('.')]
-  except ValueError:
-    raise InvalidVersion(full_version)
-  if len(parts) != 3:
+  match = VERSION_REGEX.match(full_version)
+  if not match:
     raise InvalidVersion(full_version)
-  return parts
+  return tuple(int(i) for i in match.groups())
 
 def is_out_of_date(current_version, latest_version):
-  major1, minor1, patch1 = parse_version(current_version)
-  major2, minor2, patch2 = parse_version(latest_version)
-  if major2 > major1: return True
-  if major1 > major2: return False
-  if minor2 > minor1: return True
-  if minor1 > minor2: return False
-  if patch2 > patch1: return True
-  if patch1 > patch2: return False
-  return False
+  return parse_version(latest_version) > parse_version(current_version)
+
+def get_update_checker_cache_path():
+  app_data = QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.StandardLocation.AppDataLocation)
+  return os.path.join(app_data, 'update-check.json')
 
 class UpdateCheckerWorker(BaseThread):
   update_available = QtCore.pyqtSignal(str)
 
-  def _run(self):
-    with urllib.request.urlopen(UPDATE_CHECKER_URL) as response:
-      status = response.status
-      if status != 200:
-        raise Exception(f'Unexpected status code while checking for updates: {status}')
+  def read_cache(self, cache_path):
+    # Returns {latest, fetched_at, etag, last_modified} or None
+    try:
+      with open(cache_path, 'rb') as f:
+        cache = json.loads(f.read())
+      if not isinstance(cache['latest'], str) or not isinstance(cache['fetched_at'], (int, float)):
+        return None
+      return cache
+    except (OSError, ValueError, KeyError, TypeError):
+      # Missing or broken cache, so just check again
+      return None
 
-      contents = response.read()
-      parsed = json.loads(contents)
-      latest_version = parsed['latest']
-      if is_out_of_date(VERSION, latest_version):
-        self.update_available.emit(latest_version)
+  def write_cache(self, cache_path, cache):
+    try:
+      os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+      with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
+    except OSError as e:
+      print(f'Failed to cache update check: {e}')
+
+  def fetch(self, cache):
+    # Returns a new cache, reusing the old one if the server says it hasn't changed
+    headers = {}
+    if cache is not None:
+      if cache.get('etag'):
+        headers['If-None-Match'] = cache['etag']
+      if cache.get('last_modified'):
+        headers['If-Modified-Since'] = cache['last_modified']
+    request = urllib.request.Request(UPDATE_CHECKER_URL, headers=headers)
+    try:
+      with urllib.request.urlopen(request, timeout=UPDATE_CHECKER_TIMEOUT_SECONDS) as response:
+        status = response.status
+        if status != 200:
+          raise Exception(f'Unexpected status code while checking for updates: {status}')
+        contents = response.read()
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+    except urllib.error.HTTPError as e:
+      if e.code == 304 and cache is not None:
+        return {**cache, 'fetched_at': time.time()}
+      raise
+
+    return {
+      'latest': json.loads(contents)['latest'],
+      'fetched_at': time.time(),
+      'etag': etag,
+      'last_modified': last_modified
+    }
+
+  def _run(self):
+    cache_path = get_update_checker_cache_path()
+    cache = self.read_cache(cache_path)
+    if cache is None or time.time() - cache['fetched_at'] > UPDATE_CHECKER_CACHE_SECONDS:
+      cache = self.fetch(cache)
+      self.write_cache(cache_path, cache)
+    latest_version = cache['latest']
+    if is_out_of_date(VERSION, latest_version):
+      self.update_available.emit(latest_version)
 
 
 class ExtractingWidget(QtWidgets.QWidget):
@@ -726,8 +942,7 @@ class MainWindow(QtWidgets.QWidget):
 
     self.resize(300, 200)
 
-    dirname = os.path.dirname(__file__)
-    self.setWindowIcon(QtGui.QIcon(os.path.join(dirname, 'icon.png')))
+    self.setWindowIcon(QtGui.QIcon(APP_ICON_PATH))
     self.setWindowTitle('Packager Extras')
 
     self.setWindowFlags(QtCore.Qt.WindowCloseButtonHint | QtCore.Qt.WindowMinimizeButtonHint)
@@ -749,7 +964,8 @@ class MainWindow(QtWidgets.QWidget):
     if ENABLE_UPDATE_CHECKER:
       self.update_checker_worker = UpdateCheckerWorker()
       self.update_checker_worker.update_available.connect(self.update_available)
-      self.update_checker_worker.start()
+      # Start after the window has been shown so that creating the thread doesn't delay it
+      QtCore.QTimer.singleShot(0, self.update_checker_worker.start)
 
     self.configure_widget = None
     self.is_process_ongoing = False
@@ -825,6 +1041,9 @@ def main():
 
   os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '1'
   app = QtWidgets.QApplication(sys.argv)
+  # AppDataLocation is derived from these, otherwise it would be named after the executable (python.exe when run from source)
+  app.setOrganizationName('TurboWarp')
+  app.setApplicationName('Packager Extras')
   window = MainWindow()
   close_pyinstaller_splash()
   window.show()